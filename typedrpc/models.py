@@ -3,30 +3,52 @@
 import enum
 import json
 from abc import ABC
-from base64 import b64encode, b64decode
+from functools import lru_cache
+from operator import attrgetter
+from os import urandom
+from binascii import a2b_base64, b2a_base64
 from datetime import datetime
 from dataclasses import (
+    MISSING,
     dataclass,
     is_dataclass,
     asdict as dataclass_asdict,
     fields as dataclass_fields,
 )
+from json.encoder import encode_basestring
+from types import NoneType
 from typing import (
+    Callable,
     ClassVar,
     Container,
+    FrozenSet,
+    Mapping,
     MutableMapping,
+    NamedTuple,
     Type,
     Set,
     Any,
     Optional,
     Iterable,
+    List,
+    Literal,
     Tuple,
     Union,
+    get_type_hints,
 )
-from uuid import uuid4
 
 import dacite
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
 
 __all__ = [
     "APIMessage",
@@ -40,6 +62,7 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=None)
 def is_optional_type(typ: Any) -> bool:
     """
     Checks whether the given type annotation is `Optional[...]` or `Union[..., None]`
@@ -51,6 +74,21 @@ def is_optional_type(typ: Any) -> bool:
     return origin is Union and args is not None and type(None) in args
 
 
+def tuple_attrgetter(*attrs: str) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Like `operator.attrgetter`, but the returned callable always returns a tuple,
+    regardless of the number of attributes
+    :param attrs: the names of the attributes to get
+    :return: a callable that gets the attributes values of an object as a tuple
+    """
+    if not attrs:
+        return lambda obj: ()
+    if len(attrs) == 1:
+        attr: str = attrs[0]
+        return lambda obj: (getattr(obj, attr),)
+    return attrgetter(*attrs)
+
+
 def dict_skip_none_factory(
     keyvalue_pairs: Iterable[Tuple[str, Any]]
 ) -> MutableMapping[str, Any]:
@@ -58,7 +96,89 @@ def dict_skip_none_factory(
     return {k: v for k, v in keyvalue_pairs if v is not None}
 
 
-# pylint: disable=too-many-return-statements,arguments-differ
+# pylint: disable=too-many-return-statements
+def _json_default(
+    obj: Any,
+    _isinstance: Callable[[Any, Any], bool] = isinstance,
+    _b2a_base64: Callable[..., bytes] = b2a_base64,
+    _datetime: Type[datetime] = datetime,
+) -> Any:
+    """
+    Fallback hook for JSON encoders, converts additional base types:
+    - bytes are base64-encoded to an ascii str
+    - set are converted to list
+    - datetime are cast to str with `.isoformat()`
+    - StrEnum are stored by their name
+    - Enum are stored by their value
+    - dataclasses are converted to dicts
+    Globals used on every call are bound as default arguments for faster lookup.
+    :param obj: the object to convert
+    :raise TypeError: if the object type is not supported
+    :return: a JSON serializable representation of the object
+    """
+    if _isinstance(obj, bytes):
+        return _b2a_base64(obj, newline=False).decode("ascii")
+    if _isinstance(obj, set):
+        return list(obj)
+    if _isinstance(obj, _datetime):
+        return obj.isoformat()
+    if _isinstance(obj, StrEnum):
+        return obj.name
+    if _isinstance(obj, enum.Enum):
+        return obj.value
+    if _isinstance(obj, SerializableDataclass):
+        return obj._asdict()
+    if is_dataclass(obj):
+        return dataclass_asdict(obj)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encodes an object to JSON bytes, using the stdlib `json` module"""
+    try:
+        # compact and without escaping non-ASCII characters, same as orjson output
+        return json.dumps(
+            obj, default=_json_default, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+    except UnicodeEncodeError:  # lone surrogates can only be encoded escaped
+        return json.dumps(obj, default=_json_default, separators=(",", ":")).encode()
+
+
+if orjson is not None:
+
+    def _dumps(obj: Any) -> bytes:
+        """
+        Encodes an object to JSON bytes, using `orjson`.
+        Falls back to the stdlib `json` module for the values `orjson` rejects,
+        like integers over 64 bits or strings with lone surrogates.
+        """
+        try:
+            # native dataclasses serialization misses fields of slots dataclasses bases
+            return orjson.dumps(
+                obj,
+                default=_json_default,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            return _json_dumps(obj)
+
+    def _loads(data: Union[str, bytes, bytearray]) -> Any:
+        """
+        Decodes JSON data to Python objects, using `orjson`.
+        Falls back to the stdlib `json` module for the data `orjson` rejects,
+        like escaped lone surrogates. Note that integers over 64 bits are decoded as floats.
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+else:  # pragma: no cover
+    _dumps = _json_dumps
+    _loads = json.loads
+
+
+# pylint: disable=arguments-differ
 class JSONExtendedEncoder(json.JSONEncoder):
     """
     `JSONEncoder` class that supports additional base types:
@@ -71,19 +191,10 @@ class JSONExtendedEncoder(json.JSONEncoder):
     """
 
     def default(self, obj: Any) -> Any:
-        if isinstance(obj, bytes):
-            return b64encode(obj).decode("ascii")
-        if isinstance(obj, set):
-            return list(obj)
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, StrEnum):
-            return obj.name
-        if isinstance(obj, enum.Enum):
-            return obj.value
-        if is_dataclass(obj):
-            return dataclass_asdict(obj)
-        return super().default(obj)
+        try:
+            return _json_default(obj)
+        except TypeError:
+            return super().default(obj)
 
 
 class JSONSkipNoneEncoder(JSONExtendedEncoder):
@@ -92,6 +203,9 @@ class JSONSkipNoneEncoder(JSONExtendedEncoder):
     """
 
     def default(self, obj: Any) -> Any:
+        if isinstance(obj, SerializableDataclass):
+            # pylint: disable=protected-access
+            return obj._asdict(dict_factory=dict_skip_none_factory)
         if is_dataclass(obj):
             return dataclass_asdict(obj, dict_factory=dict_skip_none_factory)
         return super().default(obj)
@@ -100,6 +214,16 @@ class JSONSkipNoneEncoder(JSONExtendedEncoder):
 class StrEnumMeta(enum.EnumMeta):
     """Metaclass for StrEnum"""
 
+    def __new__(mcs, *args: Any, **kwargs: Any):
+        """
+        Creates the enum class, also building a lookup table of its members
+        by both name and value, with names taking precedence.
+        Done in `__new__` because the enum functional API bypasses `__init__`.
+        """
+        cls = super().__new__(mcs, *args, **kwargs)
+        cls._combined_map_ = {**cls._value2member_map_, **cls._member_map_}
+        return cls
+
     # pylint: disable=signature-differs
     def __call__(
         cls, enum_name: Any, *args: Any, **kwargs: Any
@@ -114,8 +238,11 @@ class StrEnumMeta(enum.EnumMeta):
         :return: the enum instance if found, or the output of `enum.EnumMeta.__call__`
         """
         if not args and not kwargs:
-            member: StrEnum = cls._member_map_.get(enum_name)
-            if member:
+            try:
+                member: Optional[StrEnum] = cls._combined_map_.get(enum_name)
+            except TypeError:  # unhashable
+                member = None
+            if member is not None:
                 return member
         return super().__call__(enum_name, *args, **kwargs)
 
@@ -128,38 +255,466 @@ class StrEnum(enum.Enum, metaclass=StrEnumMeta):
     """
 
 
+def _references_type(
+    typ: Any, predicate: Callable[[type], bool], _seen: Optional[Set[type]] = None
+) -> bool:
+    """
+    Checks whether the given type annotation references a type matching the predicate,
+    either directly, as an argument of a generic type, or in the fields of a dataclass.
+    Dataclasses whose fields annotations can't be resolved are assumed to match.
+    :param typ: the type annotation to check
+    :param predicate: a function that checks a single type
+    :return: True if any matching type is referenced else False
+    """
+    if isinstance(typ, type):
+        if predicate(typ):
+            return True
+        if is_dataclass(typ):
+            _seen = _seen if _seen is not None else set()
+            if typ in _seen:
+                return False
+            _seen.add(typ)
+            field_types: Optional[Mapping[str, Any]] = _get_field_types(typ)
+            if field_types is None:
+                return True
+            return any(
+                _references_type(field_type, predicate, _seen)
+                for field_type in field_types.values()
+            )
+    return any(
+        _references_type(arg, predicate, _seen)
+        for arg in getattr(typ, "__args__", None) or ()
+    )
+
+
+def _is_str_enum(typ: type) -> bool:
+    """Checks whether the given type is a `StrEnum` subclass"""
+    return issubclass(typ, StrEnum)
+
+
+def _unwrap_optional_type(typ: Any) -> Any:
+    """
+    Returns the wrapped type of an `Optional[...]` type annotation
+    :param typ: the type annotation
+    :return: the type wrapped by `Optional`, or the type annotation itself otherwise
+    """
+    if is_optional_type(typ):
+        args: Tuple[Any, ...] = tuple(
+            arg for arg in typ.__args__ if arg is not NoneType
+        )
+        if len(args) == 1:
+            return args[0]
+    return typ
+
+
+def _get_field_types(cls: type) -> Optional[Mapping[str, Any]]:
+    """
+    Returns the resolved type annotations of a dataclass fields
+    :param cls: the dataclass type
+    :return: a mapping of fields names to their types, or None if they can't be resolved
+    """
+    try:
+        type_hints: Mapping[str, Any] = get_type_hints(cls)
+    except (NameError, TypeError):
+        return None
+    # noinspection PyDataclass
+    return {field.name: type_hints[field.name] for field in dataclass_fields(cls)}
+
+
+def _is_atomic_type(typ: Any) -> bool:
+    """
+    Checks whether the given type annotation is of an atomic type,
+    whose values are kept as they are by `dataclasses.asdict`:
+    `str`, `int`, `float`, `bool`, `bytes`, `datetime`, enums,
+    or `Optional` of those
+    :param typ: the type annotation to check
+    :return: True if atomic else False
+    """
+    typ = _unwrap_optional_type(typ)
+    if typ in (str, int, float, bool, bytes, datetime, type(None)):
+        return True
+    return isinstance(typ, type) and issubclass(typ, enum.Enum)
+
+
+# generated functions returning the JSON string of an instance, see `_make_fast_to_json`
+_FastToJSON = Callable[[Any], Optional[str]]
+
+_FAST_JSON_FORMATTERS: Mapping[type, str] = {
+    str: "_encode_str({var})",
+    int: "_int_repr({var})",
+    bool: '("true" if {var} else "false")',
+}
+
+
+def _make_fast_to_json(field_types: Mapping[str, Any]) -> Optional[_FastToJSON]:
+    """
+    Generates a function that directly builds the JSON string of a dataclass instance,
+    for dataclasses with only `str`, `int` or `bool` fields (or `Optional` of those).
+    Strings are encoded without escaping non-ASCII characters, the same as `_dumps`.
+    The generated function returns None if any value doesn't match its field's type.
+    :param field_types: a mapping of the names of the fields to encode to their types
+    :return: the generated function, or None if any field type isn't supported
+    """
+    lines: List[str] = ["def _fast_to_json(obj):"]
+    parts: List[str] = []
+    for idx, (name, typ) in enumerate(field_types.items()):
+        typ = _unwrap_optional_type(typ)
+        if typ not in _FAST_JSON_FORMATTERS:
+            return None
+        var: str = f"v{idx}"
+        lines += [
+            f"    {var} = obj.{name}",
+            f"    if {var} is not None and type({var}) is not _{typ.__name__}:",
+            "        return None",
+        ]
+        literal: str = ("," if parts else "{") + encode_basestring(name) + ":"
+        formatted: str = _FAST_JSON_FORMATTERS[typ].format(var=var)
+        parts.append(f'{literal!r} + ("null" if {var} is None else {formatted})')
+    parts.append(repr("}" if parts else "{}"))
+    lines.append(f"    return {' + '.join(parts)}")
+    namespace: MutableMapping[str, Any] = {
+        "_str": str,
+        "_int": int,
+        "_bool": bool,
+        "_encode_str": encode_basestring,
+        "_int_repr": int.__repr__,
+    }
+    exec("\n".join(lines), namespace)  # nosec  # pylint: disable=exec-used
+    return namespace["_fast_to_json"]
+
+
+def _make_type_checker(typ: type) -> Callable[[Any], Any]:
+    """
+    Makes a converter function that returns values of the given type unchanged
+    :param typ: the expected type of the values
+    :return: the function, raising TypeError for values of other types
+    """
+
+    def check_type(value: Any) -> Any:
+        if not isinstance(value, typ):
+            raise TypeError(f"Expected {typ.__name__}, got {type(value).__name__}")
+        return value
+
+    return check_type
+
+
+# names of some fields with a getter for all their values at once
+_FieldsGetter = Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]
+# fallback type, so that annotations resolve even when msgspec isn't installed
+_MsgspecDecoder = msgspec.json.Decoder if msgspec is not None else Any
+
+
+class _ConstructSpec(NamedTuple):
+    """Cached fields information for `SerializableDataclass.fast_from_dict`"""
+
+    field_names: FrozenSet[str]
+    defaults: Mapping[str, Any]
+    default_factories: Mapping[str, Callable[[], Any]]
+    converters: Mapping[str, Callable[[Any], Any]]
+
+
+def _raise_post_init_error(exc: Exception) -> None:
+    """
+    Re-raises the `TypeError` wrapped by a `msgspec.ValidationError`, if any,
+    so that errors from dataclasses `__post_init__` are the same as without `msgspec`
+    :param exc: the `msgspec.ValidationError` exception
+    """
+    if isinstance(exc.__cause__, TypeError):
+        raise exc.__cause__ from None
+
+
 class SerializableDataclass(ABC):
     """
     Base class for dataclasses that enable serialization/deserialization
     from JSON strings or dict objects.
-    Leverages the `dacite` package under the hood.
+    Leverages the `msgspec` package under the hood if available,
+    otherwise falls back to `dacite`.
     """
 
+    __slots__ = ()
+
     _dict_excluded_fields: ClassVar[Container[str]] = set()
     _serialization_excluded_fields: ClassVar[Container[str]] = set()
+    _json_excluded_fields: ClassVar[FrozenSet[str]] = frozenset()
     _dict_factory: ClassVar[Type[MutableMapping]] = dict
     _from_dict_config: ClassVar[dacite.Config] = dacite.Config(
-        type_hooks={bytes: b64decode, datetime: datetime.fromisoformat},
+        type_hooks={bytes: a2b_base64, datetime: datetime.fromisoformat},
         cast=[Set, enum.Enum],
     )
     _json_encoder_cls: ClassVar[Type[json.JSONEncoder]] = JSONExtendedEncoder
     _json_decoder_cls: ClassVar[Type[json.JSONDecoder]] = json.JSONDecoder
+    _json_encoder: ClassVar[Optional[json.JSONEncoder]] = None
+    _json_decoder: ClassVar[Optional[json.JSONDecoder]] = None
+    # lazily built caches: None until first use, False if unsupported by the class
+    _msgspec_decoder: ClassVar[Optional[Union[_MsgspecDecoder, Literal[False]]]] = None
+    _construct_spec: ClassVar[Optional[Union[_ConstructSpec, Literal[False]]]] = None
+    _fast_to_json: ClassVar[Optional[Union[_FastToJSON, Literal[False]]]] = None
+    _flat_fields: ClassVar[Optional[Union[_FieldsGetter, Literal[False]]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._json_excluded_fields = frozenset(cls._dict_excluded_fields) | frozenset(
+            cls._serialization_excluded_fields
+        )
+        # decoders are built lazily, once the dataclass fields are available
+        cls._msgspec_decoder = None
+        cls._construct_spec = None
+        cls._fast_to_json = None
+        cls._flat_fields = None
 
-    def to_dict(self) -> MutableMapping[str, Any]:
-        """Converts the dataclass instance to dict"""
+    @classmethod
+    def _get_json_encoder(cls) -> json.JSONEncoder:
+        """
+        Returns the shared instance of the class' `_json_encoder_cls`, creating it on first use
+        """
+        encoder: Optional[json.JSONEncoder] = cls._json_encoder
+        if encoder.__class__ is not cls._json_encoder_cls:
+            encoder = cls._json_encoder_cls()
+            cls._json_encoder = encoder
+        return encoder
+
+    @classmethod
+    def _get_json_decoder(cls) -> json.JSONDecoder:
+        """
+        Returns the shared instance of the class' `_json_decoder_cls`, creating it on first use
+        """
+        decoder: Optional[json.JSONDecoder] = cls._json_decoder
+        if decoder.__class__ is not cls._json_decoder_cls:
+            decoder = cls._json_decoder_cls()
+            cls._json_decoder = decoder
+        return decoder
+
+    @classmethod
+    def _get_msgspec_decoder(cls) -> Union[_MsgspecDecoder, Literal[False]]:
+        """
+        Returns the cached `msgspec` JSON decoder for the class, building it on first use.
+        Classes whose fields reference `StrEnum` types (decoded by name) or that
+        customize `_from_dict_config` are not supported by `msgspec`,
+        nor are fields types that `msgspec` itself rejects.
+        :return: the `msgspec.json.Decoder` instance, or False if unsupported
+        """
+        decoder = cls._msgspec_decoder
+        if decoder is None:
+            decoder = False
+            if (
+                msgspec is not None
+                and is_dataclass(cls)
+                and cls._from_dict_config is SerializableDataclass._from_dict_config
+            ):
+                field_types = _get_field_types(cls)
+                if field_types is not None and not any(
+                    _references_type(typ, _is_str_enum) for typ in field_types.values()
+                ):
+                    try:
+                        decoder = msgspec.json.Decoder(cls)
+                    except TypeError:  # e.g. unions of multiple dataclasses
+                        decoder = False
+            cls._msgspec_decoder = decoder
+        return decoder
+
+    @classmethod
+    def _get_fast_to_json(cls) -> Union[_FastToJSON, Literal[False]]:
+        """
+        Returns the cached generated function that builds the JSON string of instances,
+        generating it on first use (see `_make_fast_to_json`).
+        Only classes with the default dict factory and JSON encoder are supported.
+        :return: the generated function, or False if unsupported
+        """
+        fast_to_json = cls._fast_to_json
+        if fast_to_json is None:
+            fast_to_json = False
+            if (
+                is_dataclass(cls)
+                and cls._dict_factory is dict
+                and cls._json_encoder_cls is JSONExtendedEncoder
+            ):
+                field_types = _get_field_types(cls)
+                if field_types is not None:
+                    fast_to_json = _make_fast_to_json(
+                        {
+                            name: typ
+                            for name, typ in field_types.items()
+                            if name not in cls._json_excluded_fields
+                        }
+                    )
+            fast_to_json = fast_to_json or False
+            cls._fast_to_json = fast_to_json
+        return fast_to_json
+
+    @classmethod
+    def _get_construct_spec(cls) -> Union[_ConstructSpec, Literal[False]]:
+        """
+        Returns the cached fields information used by `fast_from_dict`,
+        collecting them on first use.
+        Only classes whose fields are all either of `str`, `int`, `float` or `bool` type,
+        or of a type directly handled by the `_from_dict_config` type hooks or casts
+        (or `Optional` of those) are supported, excluding containers and nested dataclasses.
+        :return: the `_ConstructSpec` instance, or False if unsupported
+        """
+        spec = cls._construct_spec
+        if spec is None:
+            spec = cls._collect_construct_spec() or False
+            cls._construct_spec = spec
+        return spec
+
+    @classmethod
+    def _collect_construct_spec(cls) -> Optional[_ConstructSpec]:
+        """
+        Collects the fields information used by `fast_from_dict`
+        :return: the `_ConstructSpec` instance, or None if unsupported
+        """
+        if not is_dataclass(cls) or not cls._supports_fast_construct():
+            return None
+        field_types = _get_field_types(cls)
+        if field_types is None:
+            return None
+        defaults: MutableMapping[str, Any] = {}
+        default_factories: MutableMapping[str, Callable[[], Any]] = {}
+        converters: MutableMapping[str, Callable[[Any], Any]] = {}
+        type_hooks = cls._from_dict_config.type_hooks
+        cast_types = [
+            getattr(typ, "__origin__", None) or typ
+            for typ in cls._from_dict_config.cast
+        ]
+        # noinspection PyDataclass
+        for field in dataclass_fields(cls):
+            if field.default is not MISSING:
+                defaults[field.name] = field.default
+            elif field.default_factory is not MISSING:
+                default_factories[field.name] = field.default_factory
+            field_type: Any = _unwrap_optional_type(field_types[field.name])
+            if field_type in type_hooks:
+                converters[field.name] = type_hooks[field_type]
+            elif field_type in (str, int, float, bool):
+                converters[field.name] = _make_type_checker(field_type)
+            elif isinstance(field_type, type) and any(
+                issubclass(field_type, cast_type) for cast_type in cast_types
+            ):
+                converters[field.name] = field_type
+            else:  # containers, unions, nested dataclasses, etc.
+                return None
+        return _ConstructSpec(
+            field_names=frozenset(field_types.keys()),
+            defaults=defaults,
+            default_factories=default_factories,
+            converters=converters,
+        )
+
+    @classmethod
+    def _supports_fast_construct(cls) -> bool:
+        """
+        Whether the class can be created by `fast_from_dict` without calling `__init__`.
+        By default only classes without a `__post_init__` method are supported.
+        """
+        return not hasattr(cls, "__post_init__")
+
+    @classmethod
+    def fast_from_dict(cls, data: Mapping[str, Any]) -> "SerializableDataclass":
+        """
+        Creates a dataclass instance from a dict, bypassing `__init__` and `__post_init__`.
+        Fields values are type checked, or go through the `_from_dict_config` type hooks and casts.
+        Falls back to `from_dict` for classes that don't support this (see
+        `_get_construct_spec`), or for values that don't match their field type.
+        Unknown keys are ignored, same as `from_dict`.
+        :param data: the fields values of the instance
+        :raise TypeError: if missing fields are found
+        :return: the dataclass instance
+        """
+        spec = cls._get_construct_spec()
+        if not spec:
+            return cls.from_dict(data)
+        values: MutableMapping[str, Any] = dict(spec.defaults)
+        for name, factory in spec.default_factories.items():
+            if name not in data:
+                values[name] = factory()
+        converters: Mapping[str, Callable[[Any], Any]] = spec.converters
+        for name, value in data.items():
+            if name not in spec.field_names:  # ignored, like `from_dict` does
+                continue
+            converter: Optional[Callable[[Any], Any]] = converters.get(name)
+            if converter is not None and value is not None:
+                try:
+                    value = converter(value)
+                except (TypeError, ValueError):
+                    return cls.from_dict(data)
+            values[name] = value
+        if len(values) != len(spec.field_names):
+            missing: str = ", ".join(sorted(spec.field_names - values.keys()))
+            raise TypeError(f"Missing fields {missing} for {cls.__name__}")
+        obj: SerializableDataclass = object.__new__(cls)
+        for name, value in values.items():
+            setattr(obj, name, value)
+        return obj
+
+    @classmethod
+    def _get_flat_field_names(cls) -> Union[_FieldsGetter, Literal[False]]:
+        """
+        Returns the cached names of the fields of the class, if they're all of atomic types
+        (see `_is_atomic_type`), checking them on first use.
+        :return: a tuple of the fields names and a getter for all their values at once,
+                 or False if any field isn't atomic
+        """
+        flat_fields = cls._flat_fields
+        if flat_fields is None:
+            flat_fields = False
+            field_types = _get_field_types(cls) if is_dataclass(cls) else None
+            if field_types is not None and all(
+                _is_atomic_type(typ) for typ in field_types.values()
+            ):
+                field_names: Tuple[str, ...] = tuple(field_types.keys())
+                flat_fields = (field_names, tuple_attrgetter(*field_names))
+            cls._flat_fields = flat_fields
+        return flat_fields
+
+    def _asdict(
+        self,
+        dict_factory: Callable[[Iterable[Tuple[str, Any]]], MutableMapping] = dict,
+    ) -> MutableMapping[str, Any]:
+        """
+        Same as `dataclasses.asdict`, but for dataclasses with only atomic fields
+        it skips the recursion and copying, getting all the values at once
+        :param dict_factory: the factory to build the dict from (key, value) pairs
+        :return: the dict of fields values
+        """
+        flat_fields = self._get_flat_field_names()
+        if flat_fields:
+            field_names, fields_getter = flat_fields
+            return dict_factory(zip(field_names, fields_getter(self)))
         assert is_dataclass(
             self
         )  # TODO: make into an exception and move to subclass init? after dataclass deco
         # noinspection PyDataclass
-        data: MutableMapping[str, Any] = dataclass_asdict(
-            self, dict_factory=self._dict_factory
-        )
-        data = {k: v for k, v in data.items() if k not in self._dict_excluded_fields}
+        return dataclass_asdict(self, dict_factory=dict_factory)
+
+    def _to_dict(self, excluded_fields: Iterable[str]) -> MutableMapping[str, Any]:
+        """
+        Converts the dataclass instance to dict, leaving out the given fields
+        :param excluded_fields: the names of the fields to exclude
+        :return: the dict of fields values
+        """
+        data: MutableMapping[str, Any] = self._asdict(dict_factory=self._dict_factory)
+        for field_name in excluded_fields:
+            data.pop(field_name, None)
         return data
 
+    def to_dict(self) -> MutableMapping[str, Any]:
+        """Converts the dataclass instance to dict"""
+        return self._to_dict(self._dict_excluded_fields)
+
     @classmethod
     def from_dict(cls, data: MutableMapping[str, Any]) -> "SerializableDataclass":
-        """Creates a dataclass instance from a dict"""
+        """
+        Creates a dataclass instance from a dict.
+        Errors raised by `__post_init__` are propagated as they are, while invalid
+        data raises `msgspec.ValidationError` if using `msgspec`,
+        otherwise `dacite.DaciteError`.
+        """
+        if cls._get_msgspec_decoder():
+            try:
+                return msgspec.convert(data, cls)
+            except msgspec.ValidationError as exc:
+                _raise_post_init_error(exc)
+                raise
         # noinspection PyTypeChecker
         return dacite.from_dict(data_class=cls, data=data, config=cls._from_dict_config)
 
@@ -172,21 +727,51 @@ class SerializableDataclass(ABC):
         :return: the encoded JSON string
         """
         data: MutableMapping[str, Any]
-        if override_data is not None:
-            data = override_data
+        # the fast paths bypass `to_dict`, so they're skipped if a subclass overrides it
+        if (
+            override_data is None
+            and type(self).to_dict is SerializableDataclass.to_dict
+        ):
+            fast_to_json = self._get_fast_to_json()
+            if fast_to_json:
+                data_str: Optional[str] = fast_to_json(self)
+                if data_str is not None:
+                    return data_str
+            data = self._to_dict(self._json_excluded_fields)
         else:
-            data = self.to_dict()
-        data = {
-            k: v
-            for k, v in data.items()
-            if k not in self._serialization_excluded_fields
-        }
-        return json.dumps(data, cls=self._json_encoder_cls)
+            if override_data is None:
+                override_data = self.to_dict()
+            data = {
+                k: v
+                for k, v in override_data.items()
+                if k not in self._serialization_excluded_fields
+            }
+        if self._json_encoder_cls is JSONExtendedEncoder:
+            return _dumps(data).decode()
+        return self._get_json_encoder().encode(data)
 
     @classmethod
-    def from_json(cls, data_str: str) -> "SerializableDataclass":
-        """Creates a dataclass instance from a JSON string"""
-        return cls.from_dict(json.loads(data_str, cls=cls._json_decoder_cls))
+    def from_json(cls, data_str: Union[str, bytes]) -> "SerializableDataclass":
+        """
+        Creates a dataclass instance from a JSON string.
+        Raises the same errors as `from_dict` for invalid data,
+        or `json.JSONDecodeError` for malformed JSON.
+        """
+        if cls._json_decoder_cls is json.JSONDecoder:
+            decoder = cls._get_msgspec_decoder()
+            if decoder:
+                try:
+                    return decoder.decode(data_str)
+                except msgspec.ValidationError as exc:
+                    _raise_post_init_error(exc)
+                    raise
+                # retried below, for the data only `json` accepts (e.g. lone surrogates)
+                except (msgspec.DecodeError, UnicodeEncodeError):
+                    pass
+            return cls.from_dict(_loads(data_str))
+        if not isinstance(data_str, str):
+            data_str = data_str.decode()
+        return cls.from_dict(cls._get_json_decoder().decode(data_str))
 
     to_str = to_json
     from_str = from_json
@@ -195,7 +780,7 @@ class SerializableDataclass(ABC):
         return self.to_json()
 
 
-@dataclass
+@dataclass(slots=True)
 class APIMessage(SerializableDataclass, ABC):
     """
     Base dataclass for API messages
@@ -204,29 +789,86 @@ class APIMessage(SerializableDataclass, ABC):
     _uid: int = None
     _type: str = None
 
+    _allowed_none_fields: ClassVar[Container[str]] = ("_uid",)
+    _required_fields: ClassVar[Optional[_FieldsGetter]] = None
+
+    def __init_subclass__(cls, **kwargs: Any):
+        # slots dataclasses are recreated by the decorator, so `super()` needs arguments
+        # pylint: disable=super-with-arguments
+        super(APIMessage, cls).__init_subclass__(**kwargs)
+        # computed lazily, once the dataclass fields are available
+        cls._required_fields = None
+
+    @classmethod
+    def _get_required_fields(cls) -> _FieldsGetter:
+        """
+        Returns the names of the fields that must not be None, caching them on the class
+        :return: a tuple of the fields names and a getter for all their values at once
+        """
+        required_fields = cls._required_fields
+        if required_fields is None:
+            field_names: Tuple[str, ...] = tuple(
+                field.name
+                for field in dataclass_fields(cls)
+                if field.name not in cls._allowed_none_fields
+                and not is_optional_type(field.type)
+            )
+            required_fields = (field_names, tuple_attrgetter(*field_names))
+            cls._required_fields = required_fields
+        return required_fields
+
+    def _check_required_fields(self) -> None:
+        """
+        Checks that all required fields are populated.
+        :raise TypeError: if any required field is None
+        """
+        field_names, fields_getter = self._get_required_fields()
+        values: Tuple[Any, ...] = fields_getter(self)
+        if None in values:
+            field_name: str = field_names[values.index(None)]
+            raise TypeError(
+                f"{field_name} must be specified for {self.__class__.__name__}"
+            )
+
     def __post_init__(self):
         """
         Initialization for dataclass instances.
         Checks that all required fields are populated.
         Also assigns a random `_uid` if not specified.
         """
-        allowed_none = ("_uid",)
-        for field in dataclass_fields(self):
-            if field.name in allowed_none:
-                continue
-            if getattr(self, field.name, None) is None and not is_optional_type(
-                field.type
-            ):
-                raise TypeError(
-                    f"{field.name} must be specified for {self.__class__.__name__}"
-                )
+        self._check_required_fields()
         if self._uid is None:
-            self._uid = uuid4().int
+            # keep within 64 bits, larger ints aren't supported by all JSON backends
+            self._uid = int.from_bytes(urandom(8), "big")
+
+    @classmethod
+    def _supports_fast_construct(cls) -> bool:
+        """
+        Only message classes that don't override `__post_init__` are supported,
+        as `fast_from_dict` performs the same initialization
+        """
+        return cls.__post_init__ is APIMessage.__post_init__
+
+    @classmethod
+    def fast_from_dict(cls, data: Mapping[str, Any]) -> "APIMessage":
+        """
+        Creates a message instance from a dict, bypassing `__init__` and `__post_init__`.
+        Required fields are still checked, and a random `_uid` assigned if missing.
+        :param data: the fields values of the message
+        :raise TypeError: if missing or unpopulated required fields are found
+        :return: the message instance
+        """
+        # pylint: disable=super-with-arguments,protected-access
+        obj: APIMessage = super(APIMessage, cls).fast_from_dict(data)
+        obj._check_required_fields()
+        if obj._uid is None:
+            obj._uid = int.from_bytes(urandom(8), "big")
+        return obj
 
     as_dict = SerializableDataclass.to_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class APIRequest(APIMessage, ABC):
     """
     Base dataclass for API requests
@@ -236,7 +878,7 @@ class APIRequest(APIMessage, ABC):
     command: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class APIResponse(APIMessage, ABC):
     """
     Base dataclass for API responses
@@ -246,7 +888,7 @@ class APIResponse(APIMessage, ABC):
     _status: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class APISuccessResponse(APIResponse):
     """
     Dataclass for successful API responses
@@ -255,7 +897,7 @@ class APISuccessResponse(APIResponse):
     _status: str = "success"
 
 
-@dataclass
+@dataclass(slots=True)
 class APIErrorResponse(APIResponse):
     """
     Dataclass for error API responses
@@ -266,7 +908,7 @@ class APIErrorResponse(APIResponse):
     error_msg: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class APIBadRequestError(APIErrorResponse):
     """
     Dataclass for bad request error API responses
@@ -276,7 +918,7 @@ class APIBadRequestError(APIErrorResponse):
     error_name: str = "bad_request"
 
 
-@dataclass
+@dataclass(slots=True)
 class APIInternalError(APIErrorResponse):
     """
     Dataclass for internal error API responses
@@ -1,10 +1,17 @@
 """RPC service using raw socket"""
 
 import json
+import selectors
 import socket
+import struct
 from abc import ABC, abstractmethod
-from typing import ClassVar, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from queue import SimpleQueue
+from threading import Event, Lock
+from typing import Any, ClassVar, List, Optional, Sequence, Tuple
 
+from .models import _dumps, _loads
 from .service import RPCError, RQ, RS, RPCServiceBase, RPCClientBase, RPCServerBase
 
 
@@ -15,7 +22,7 @@ __all__ = [
 ]
 
 
-# pylint: disable=not-callable,missing-function-docstring
+# pylint: disable=not-callable,no-member,missing-function-docstring
 class RPCSocketServiceBase(RPCServiceBase[RQ, RS], ABC):
     """
     Common base class for JSON RPC over TCP servers and clients classes
@@ -24,8 +31,9 @@ class RPCSocketServiceBase(RPCServiceBase[RQ, RS], ABC):
     _ping_resp: ClassVar[bytes] = b"pong"
     _ping_req: ClassVar[bytes] = b"ping"
     _socket_timeout: ClassVar[float] = 10.0
-    _buffer_size: ClassVar[int] = 4096
-    _eof: bytes = b"\0"
+    _protocol_version: ClassVar[int] = 2
+    _frame_header: ClassVar[struct.Struct] = struct.Struct("!BI")
+    _max_frame_size: ClassVar[int] = 64 * 1024 * 1024
 
     def _setup_socket(self, timeout: Optional[float] = None) -> socket.socket:
         """
@@ -35,22 +43,78 @@ class RPCSocketServiceBase(RPCServiceBase[RQ, RS], ABC):
         :return: the prepared socket instance
         """
         sock: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         sock.settimeout(timeout if timeout is not None else self._socket_timeout)
         return sock
 
-    def _recv_data(self, sock: socket.socket) -> bytes:
+    def _send_framed(self, sock: socket.socket, payload: bytes) -> None:
         """
-        Receives raw data from a socket
+        Sends raw data through a socket as a single frame,
+        prefixed with a header of the protocol version and the data length
         :param sock: the socket
-        :return: the raw data in bytes (stripped of \0 and leading/trailing whitespace)
+        :param payload: the raw data in bytes
         """
-        resp_data_raw: bytes = b""
-        while True:
-            data_chunk: bytes = sock.recv(self._buffer_size)
-            resp_data_raw += data_chunk
-            if self._eof in data_chunk or not data_chunk:
+        header: bytes = self._frame_header.pack(self._protocol_version, len(payload))
+        if not hasattr(sock, "sendmsg"):  # not available on Windows
+            sock.sendall(header + payload)
+            return
+        # scatter-gather send, avoids copying the payload to prepend the header
+        sent: int = sock.sendmsg([header, payload])
+        if sent < len(header):
+            sock.sendall(header[sent:])
+            sent = len(header)
+        if sent - len(header) < len(payload):
+            sock.sendall(memoryview(payload)[sent - len(header) :])
+
+    @staticmethod
+    def _recv_exact(sock: socket.socket, size: int) -> Tuple[bytearray, int]:
+        """
+        Receives exactly the given amount of raw data from a socket,
+        unless the connection is closed first
+        :param sock: the socket
+        :param size: the amount of bytes to receive
+        :return: a tuple of the buffer for the data and the amount of bytes received
+        """
+        buffer: bytearray = bytearray(size)
+        view: memoryview = memoryview(buffer)
+        received: int = 0
+        while received < size:
+            chunk_size: int = sock.recv_into(view[received:])
+            if not chunk_size:
                 break
-        return resp_data_raw.rstrip(b"\0").strip()
+            received += chunk_size
+        return buffer, received
+
+    def _recv_framed(self, sock: socket.socket) -> Optional[bytearray]:
+        """
+        Receives a single frame of raw data from a socket
+        :param sock: the socket
+        :raise RPCError: if the frame has an unsupported protocol version,
+                         exceeds the class' `_max_frame_size`,
+                         or the connection is closed before the frame is complete
+        :return: the raw data, in the buffer it was received into (avoiding a copy),
+                 or None if the connection was closed before receiving any frame
+        """
+        header_size: int = self._frame_header.size
+        header, received = self._recv_exact(sock, header_size)
+        if not received:
+            return None
+        if received < header_size:
+            raise RPCError("Connection closed while receiving frame header")
+        version, size = self._frame_header.unpack(header)
+        if version != self._protocol_version:
+            raise RPCError(
+                f"Unsupported protocol version {version} "
+                f"(expected {self._protocol_version})"
+            )
+        if size > self._max_frame_size:
+            raise RPCError(
+                f"Frame size {size} exceeds the maximum of {self._max_frame_size} bytes"
+            )
+        payload, received = self._recv_exact(sock, size)
+        if received < size:
+            raise RPCError("Connection closed while receiving frame data")
+        return payload
 
     @property
     @abstractmethod
@@ -66,6 +130,21 @@ class RPCSocketClientBase(RPCClientBase[RQ, RS], RPCSocketServiceBase[RQ, RS], A
     Base class for client classes that implement JSON RPC over TCP clients
     """
 
+    _conn: Optional[socket.socket] = None
+    _conn_lock: Optional[Lock] = None
+    _conn_lock_init: ClassVar[Lock] = Lock()
+
+    def _get_conn_lock(self) -> Lock:
+        """
+        Returns the lock guarding the persistent connection, creating it on first use,
+        so that it doesn't depend on `__init__` being called by subclasses
+        """
+        if self._conn_lock is None:
+            with self._conn_lock_init:
+                if self._conn_lock is None:
+                    self._conn_lock = Lock()
+        return self._conn_lock
+
     def _create_socket(self, **setup_socket_kwargs) -> socket.socket:
         """
         Creates the socket and connects to the server address
@@ -76,24 +155,65 @@ class RPCSocketClientBase(RPCClientBase[RQ, RS], RPCSocketServiceBase[RQ, RS], A
         sock.connect(self._socket_address)
         return sock
 
+    def _close_conn(self) -> None:
+        """
+        Closes the persistent connection to the server, if open
+        """
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def close(self) -> None:
+        """
+        Closes the persistent connection to the server.
+        A new one is opened on the next request.
+        """
+        with self._get_conn_lock():
+            self._close_conn()
+
     def _send_and_receive(
         self, req_data_raw: bytes, skip_receive: bool = False, **create_socket_kwargs
-    ) -> bytes:
+    ) -> bytearray:
         """
-        Sends a raw request and awaits for a raw response
+        Sends a raw request and awaits for a raw response.
+        Requests are sent through a persistent connection, opened on first use
+        and reopened on the next request if any error occurs.
         :param req_data_raw: the raw request data in bytes
         :param skip_receive: don't wait for a response,
-                             returns immediately after sending the request
-        :param create_socket_kwargs: additional keyword arguments for socket creation
+                             returns immediately after sending the request.
+                             Uses a separate connection that is closed right away.
+        :param create_socket_kwargs: additional keyword arguments for socket creation,
+                                     used when a new connection is opened.
+                                     A `timeout` is also applied to a reused connection.
         :raise RPCError: if any socket error happen while sending or receiving data
-        :return: the raw response bytes or, if `skip_receive` is True, empty bytes
+        :return: the raw response data or, if `skip_receive` is True, an empty bytearray
         """
-        try:
-            with self._create_socket(**create_socket_kwargs) as sock:
-                sock.send(req_data_raw + self._eof)
-                resp_data_raw = self._recv_data(sock) if not skip_receive else b""
-        except (OSError, socket.error) as exc:
-            raise RPCError(f"Socket error: {exc}") from exc
+        if skip_receive:
+            try:
+                with self._create_socket(**create_socket_kwargs) as sock:
+                    self._send_framed(sock, req_data_raw)
+            except (OSError, socket.error) as exc:
+                raise RPCError(f"Socket error: {exc}") from exc
+            return bytearray()
+        with self._get_conn_lock():
+            try:
+                if self._conn is None:
+                    self._conn = self._create_socket(**create_socket_kwargs)
+                else:
+                    timeout: Optional[float] = create_socket_kwargs.get("timeout")
+                    self._conn.settimeout(
+                        timeout if timeout is not None else self._socket_timeout
+                    )
+                self._send_framed(self._conn, req_data_raw)
+                resp_data_raw: Optional[bytearray] = self._recv_framed(self._conn)
+                if resp_data_raw is None:
+                    raise RPCError("Connection closed by the server without a response")
+            except (OSError, socket.error) as exc:
+                self._close_conn()
+                raise RPCError(f"Socket error: {exc}") from exc
+            except RPCError:
+                self._close_conn()
+                raise
         return resp_data_raw
 
     # TODO: implement proper ping request-response
@@ -104,7 +224,9 @@ class RPCSocketClientBase(RPCClientBase[RQ, RS], RPCSocketServiceBase[RQ, RS], A
         :return: True if the ping was successful else False
         """
         try:
-            resp: bytes = self._send_and_receive(self._ping_req, **create_socket_kwargs)
+            resp: bytearray = self._send_and_receive(
+                self._ping_req, **create_socket_kwargs
+            )
             if resp != self._ping_resp:
                 raise RPCError("Invalid ping response")
         except RPCError:
@@ -120,18 +242,45 @@ class RPCSocketClientBase(RPCClientBase[RQ, RS], RPCSocketServiceBase[RQ, RS], A
         :return: the response data as an instance of the bound response class
         """
         # TODO: Validate request
-        req_data_raw: bytes = json.dumps(req_data).encode()
-        resp_data_raw: bytes = self._send_and_receive(
+        req_data_raw: bytes = _dumps(req_data)
+        resp_data_raw: bytearray = self._send_and_receive(
             req_data_raw, **create_socket_kwargs
         )
 
         try:
-            resp_data: RS = self._resp_cls(**json.loads(resp_data_raw))
+            resp_data: RS = self._resp_cls.fast_from_dict(_loads(resp_data_raw))
         except json.JSONDecodeError as exc:
             raise RPCError(f"Failed decoding json response: {exc}") from exc
         # TODO: Validate response
         return resp_data
 
+    def _rpc_batch(self, reqs_data: Sequence[RQ], **create_socket_kwargs) -> List[RS]:
+        """
+        Sends multiple requests at once, as a single JSON array,
+        and awaits for all the responses
+        :param reqs_data: the requests data as instances of the bound request class
+        :param create_socket_kwargs: additional keyword arguments for socket creation
+        :raise RPCError: if any socket or response data errors happen
+        :return: the responses data as instances of the bound response class,
+                 in the same order as the requests
+        """
+        reqs_data_raw: bytes = _dumps(list(reqs_data))
+        resps_data_raw: bytearray = self._send_and_receive(
+            reqs_data_raw, **create_socket_kwargs
+        )
+
+        try:
+            resps_data_json: Any = _loads(resps_data_raw)
+        except json.JSONDecodeError as exc:
+            raise RPCError(f"Failed decoding json response: {exc}") from exc
+        if not isinstance(resps_data_json, list) or len(resps_data_json) != len(
+            reqs_data
+        ):
+            raise RPCError("Invalid batch response, expected one for each request")
+        return [
+            self._resp_cls.fast_from_dict(resp_data) for resp_data in resps_data_json
+        ]
+
 
 # pylint: disable=missing-function-docstring
 class RPCSocketServerBase(RPCServerBase[RQ, RS], RPCSocketServiceBase[RQ, RS], ABC):
@@ -140,6 +289,12 @@ class RPCSocketServerBase(RPCServerBase[RQ, RS], RPCSocketServiceBase[RQ, RS], A
     """
 
     _socket_timeout: ClassVar[float] = 1.0
+    # timeout for each send or receive on clients connections, None for blocking.
+    # Idle connections are waited on by the selector instead.
+    _conn_timeout: ClassVar[Optional[float]] = None
+    _max_workers: ClassVar[Optional[int]] = None
+    _stop_event: Optional[Event] = None
+    _pool: Optional[ThreadPoolExecutor] = None
 
     def _create_socket(self, **setup_socket_kwargs) -> socket.socket:
         """
@@ -148,36 +303,164 @@ class RPCSocketServerBase(RPCServerBase[RQ, RS], RPCSocketServiceBase[RQ, RS], A
         :return: the connected socket
         """
         sock = self._setup_socket(**setup_socket_kwargs)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         sock.bind(self._socket_address)
         sock.listen()
         return sock
 
     def _listen(self, **create_socket_kwargs) -> None:
         """
-        Listens indefinitely for clients connections and handles requests.
+        Listens for clients connections until stopped.
+        Idle connections are multiplexed with a selector, and only the ones with
+        an incoming request are handled in the server's thread pool, so that
+        the pool size limits the concurrent requests, not the connected clients.
         :param create_socket_kwargs: additional keyword arguments for socket creation
         """
-        with self._create_socket(**create_socket_kwargs) as sock:
+        assert self._stop_event is not None and self._pool is not None
+        pool: ThreadPoolExecutor = self._pool
+        # connections handed back by the pool, only registered again by this thread
+        idle_conns: SimpleQueue[Tuple[socket.socket, Tuple[str, int]]] = SimpleQueue()
+        wakeup_recv, wakeup_send = socket.socketpair()
+        wakeup_recv.setblocking(False)
+        wakeup_send.setblocking(False)
+
+        def request_done(
+            conn: socket.socket, addr: Tuple[str, int], future: Future
+        ) -> None:
+            if not future.result():
+                conn.close()
+                return
+            idle_conns.put((conn, addr))
+            try:
+                wakeup_send.send(b"\0")
+            except OSError:  # buffer full (a wakeup is pending already) or closed
+                pass
+
+        with wakeup_recv, wakeup_send, self._create_socket(
+            **create_socket_kwargs
+        ) as sock, selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_READ)
+            selector.register(wakeup_recv, selectors.EVENT_READ)
             print(f"RPC server listening on {self._socket_address}")
-            while True:
-                try:
-                    conn, addr = sock.accept()
-                except socket.timeout:
-                    self._no_clients_timeout_callback()
-                    continue
-                with conn:
-                    print(f"New RPC connection from {addr}")
-                    req_data_raw: bytes = self._recv_data(conn)
-                    if req_data_raw == self._ping_req:
-                        conn.sendall(self._ping_resp + self._eof)
-                    else:
-                        req_data: RQ = self._req_cls(**json.loads(req_data_raw))
-                        resp_data: RS = self.rpc_callback(req_data)
-                        resp_data_raw: bytes = json.dumps(resp_data).encode()
-                        conn.sendall(resp_data_raw)
-
-    def start(self, **kwargs) -> None:
-        self._listen(**kwargs)
+            try:
+                while not self._stop_event.is_set():
+                    events = selector.select(self._socket_timeout)
+                    if not events:
+                        self._no_clients_timeout_callback()
+                    for key, _ in events:
+                        if key.fileobj is sock:
+                            self._accept_conn(sock, selector)
+                        elif key.fileobj is wakeup_recv:
+                            try:
+                                wakeup_recv.recv(4096)
+                            except BlockingIOError:
+                                pass
+                        else:
+                            selector.unregister(key.fileobj)
+                            pool.submit(
+                                self._handle_request, key.fileobj, key.data
+                            ).add_done_callback(
+                                partial(request_done, key.fileobj, key.data)
+                            )
+                    while not idle_conns.empty():
+                        conn, addr = idle_conns.get()
+                        selector.register(conn, selectors.EVENT_READ, addr)
+            finally:
+                pool.shutdown(wait=True)  # let in-flight requests hand back their conns
+                while not idle_conns.empty():
+                    idle_conns.get()[0].close()
+                for key in list(selector.get_map().values()):
+                    if key.data is not None:  # client connections
+                        key.fileobj.close()
+
+    def _accept_conn(
+        self, sock: socket.socket, selector: selectors.BaseSelector
+    ) -> None:
+        """
+        Accepts a new client connection and registers it as idle in the selector
+        :param sock: the server listening socket
+        :param selector: the selector for idle connections
+        """
+        try:
+            conn, addr = sock.accept()
+        except socket.timeout:
+            return
+        print(f"New RPC connection from {addr}")
+        try:
+            self._setup_connection(conn)
+        except OSError as exc:
+            print(f"Error setting up RPC connection from {addr}: {exc!r}")
+            conn.close()
+            return
+        selector.register(conn, selectors.EVENT_READ, addr)
+
+    def _handle_request(self, conn: socket.socket, addr: Tuple[str, int]) -> bool:
+        """
+        Handles a single request from a client connection, sending back the response
+        :param conn: the connection socket, with incoming data ready to be received
+        :param addr: the client address
+        :return: True if the connection can be kept open for further requests,
+                 False if the client disconnected or an error occurred
+        """
+        try:
+            req_data_raw: Optional[bytearray] = self._recv_framed(conn)
+            if req_data_raw is None:
+                return False
+            resp_data_raw: bytes
+            if req_data_raw == self._ping_req:
+                resp_data_raw = self._ping_resp
+            elif req_data_raw[:1] == b"[":
+                reqs_data: List[RQ] = [
+                    self._req_cls.fast_from_dict(req_data)
+                    for req_data in _loads(req_data_raw)
+                ]
+                resp_data_raw = _dumps(
+                    [self.rpc_callback(req_data) for req_data in reqs_data]
+                )
+            else:
+                req_data: RQ = self._req_cls.fast_from_dict(_loads(req_data_raw))
+                resp_data: RS = self.rpc_callback(req_data)
+                resp_data_raw = _dumps(resp_data)
+            self._send_framed(conn, resp_data_raw)
+        except RPCError as exc:
+            print(f"Invalid RPC request from {addr}: {exc}")
+            return False
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"Error handling RPC connection from {addr}: {exc!r}")
+            return False
+        return True
+
+    def _setup_connection(self, conn: socket.socket) -> None:
+        """
+        Configures an accepted client connection socket
+        :param conn: the connection socket
+        """
+        conn.settimeout(self._conn_timeout)
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, "TCP_QUICKACK"):  # Linux only
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+    def start(self, stop_event: Optional[Event] = None, **kwargs) -> None:
+        """
+        Starts the server, handling clients connections until stopped.
+        Can be used as the main function of a `BackgroundServiceThread`.
+        :param stop_event: an event that stops the server when set.
+                           If omitted a new one is created, set by `.stop()`
+        :param kwargs: additional keyword arguments for socket creation
+        """
+        self._stop_event = stop_event if stop_event is not None else Event()
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix=self.__class__.__name__
+        ) as pool:
+            self._pool = pool
+            try:
+                self._listen(**kwargs)
+            finally:
+                self._pool = None
+
+    def stop(self) -> None:
+        if self._stop_event is not None:
+            self._stop_event.set()
 
     def _no_clients_timeout_callback(self) -> None:
         """
@@ -1,8 +1,18 @@
 """Background threading base classes"""
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from itertools import count
 from threading import Event, Thread
-from typing import Optional, Protocol, Any, Counter, Iterable, MutableMapping
+from typing import (
+    Optional,
+    Protocol,
+    Any,
+    DefaultDict,
+    Iterable,
+    Iterator,
+    MutableMapping,
+)
 
 
 __all__ = [
@@ -70,7 +80,14 @@ class BackgroundServiceThreadBase(ABC):
         self.stop()
 
     def __del__(self):
-        self.stop()
+        # only stop threads still running, without waiting, as this might be called
+        # during interpreter shutdown, or on a partially initialized instance
+        thread: Optional[Thread] = getattr(self, "_thread", None)
+        if thread is not None and thread.is_alive():
+            try:
+                self.stop(wait=False)
+            except Exception:  # pylint: disable=broad-except
+                pass
 
 
 class StoppableThreadMain(Protocol):
@@ -87,7 +104,7 @@ class BackgroundServiceThread(BackgroundServiceThreadBase):
 
     default_thread_name: str = "BackgroundServiceThread"
     # noinspection PyTypeHints
-    _services_count: Counter[str] = Counter()
+    _services_count: DefaultDict[str, Iterator[int]] = defaultdict(count)
 
     def __init__(
         self,
@@ -113,9 +130,7 @@ class BackgroundServiceThread(BackgroundServiceThreadBase):
         self._exec_kwargs: MutableMapping[str, Any] = exec_kwargs or {}
         if thread_name is None:
             thread_name = self.default_thread_name
-        self._thread_name: Optional[str] = None
-        self.thread_name = thread_name
-        self.__class__._services_count[self.thread_name] += 1
+        self._thread_name: str = thread_name
         super().__init__(*args, **kwargs)
 
     @property
@@ -133,17 +148,13 @@ class BackgroundServiceThread(BackgroundServiceThreadBase):
     @thread_name.setter
     def thread_name(self, name: str):
         """Sets the service thread's name"""
-        if self._thread_name is not None:
-            self._services_count[self._thread_name] -= 1
         self._thread_name = name
-        self._services_count[self.thread_name] += 1
         if self._thread is not None:
             self._thread.name = self._make_thread_name()
 
     def _make_thread_name(self) -> str:
         """Helper function to generate the final thread's name"""
-        assert self._thread_name is not None
-        same_name_count: int = self._services_count[self._thread_name]
+        same_name_count: int = next(self._services_count[self._thread_name])
         same_name_postfix: str = f"-{same_name_count}" if same_name_count else ""
         return self._thread_name + same_name_postfix
 